@@ -27,7 +27,7 @@ async def stop_bot(message: Message):
     )
 
 async def main():
-    await dp.start_polling(bot)
+    await dp.start_polling(bot, polling_timeout=30)
 
 if __name__ == "__main__":
     asyncio.run(main())